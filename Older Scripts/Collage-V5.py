@@ -1,11 +1,25 @@
 import os
 import base64
 import json
+import math
+import threading
+import zipfile
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import tkinter as tk
 import tkinter.ttk as ttk
 from tkinter import filedialog, messagebox
 from io import BytesIO
-from PIL import Image, ImageTk, ImageDraw
+import PIL
+from PIL import Image, ImageDraw, features
+
+# Pillow-SIMD is a drop-in fork of Pillow with SSE4/AVX2 resampling kernels;
+# its version strings carry a ".post" suffix (e.g. "9.5.0.post1").
+PILLOW_SIMD = ".post" in PIL.__version__
+# Official Pillow wheels decode JPEGs with libjpeg-turbo; some distro and source
+# builds link plain libjpeg, which is roughly half as fast on large photos.
+JPEG_TURBO = "libjpeg_turbo" in features.features and bool(features.check_feature("libjpeg_turbo"))
 
 # ----------------------------------------------------------------
 # Global Style / Color Configuration
@@ -16,16 +30,24 @@ ACCENT_COLOR    = "#dc5697"   # Accent color
 TEXT_COLOR      = "#000000"   # Text color for dark backgrounds
 WINDOW_ALPHA = 1.00  # overall window transparency
 
+# int(c, 16) alone would also accept "0x1234", "+abcde" or "12_345".
+_HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
+
+@lru_cache(maxsize=256)
 def hex_to_rgb(hex_color):
     c = hex_color.strip()
     if c.startswith("#"):
         c = c[1:]
-    if len(c) == 6:
-        return (int(c[0:2],16), int(c[2:4],16), int(c[4:6],16))
+    if len(c) == 6 and _HEX_DIGITS.issuperset(c):
+        v = int(c, 16)
+        return ((v >> 16) & 0xff, (v >> 8) & 0xff, v & 0xff)
     return (0, 0, 0)
 
+_HEX = tuple(f"{i:02x}" for i in range(256))  # two-digit hex for each channel value
+
 def rgb_to_hex(rgb):
-    return "#{:02x}{:02x}{:02x}".format(*rgb)
+    r, g, b = rgb
+    return "#" + _HEX[r] + _HEX[g] + _HEX[b]
 
 def lighten_color(hex_color, factor=0.2):
     r, g, b = hex_to_rgb(hex_color)
@@ -43,43 +65,63 @@ def darken_color(hex_color, factor=0.2):
 
 ACCENT_HOVER   = lighten_color(ACCENT_COLOR, 0.2)
 ACCENT_PRESSED = darken_color(ACCENT_COLOR, 0.2)
+SECONDARY_SELECT = darken_color(SECONDARY_COLOR, 0.3)  # listbox selection
 
 # ----------------------------------------------------------------
 # Utility Functions for Image Processing
 # ----------------------------------------------------------------
+@lru_cache(maxsize=256)
 def parse_hex_color(hex_color: str):
     c = hex_color.strip()
     if c.startswith('#'):
         c = c[1:]
-    if len(c) == 6:
-        try:
-            r = int(c[0:2],16)
-            g = int(c[2:4],16)
-            b = int(c[4:6],16)
-            return (r, g, b, 255)
-        except ValueError:
-            pass
+    if len(c) == 6 and _HEX_DIGITS.issuperset(c):
+        v = int(c, 16)
+        return (v >> 16, (v >> 8) & 0xff, v & 0xff, 255)
     return (0, 0, 0, 255)
 
-def crop_to_aspect(img, target_w, target_h):
-    orig_w, orig_h = img.size
+def crop_to_aspect_box(orig_w, orig_h, target_w, target_h):
+    # Centered crop box matching the target aspect; pass it as Image.resize(box=...)
+    # so the crop and the resample happen in a single pass.
     target_aspect = target_w / target_h
     orig_aspect = orig_w / orig_h
     if target_aspect > orig_aspect:
-        new_height = int(orig_w / target_aspect)
-        top = (orig_h - new_height) // 2
-        return img.crop((0, top, orig_w, top + new_height))
+        new_height = orig_w / target_aspect
+        top = (orig_h - new_height) / 2
+        return (0, top, orig_w, top + new_height)
     else:
-        new_width = int(orig_h * target_aspect)
-        left = (orig_w - new_width) // 2
-        return img.crop((left, 0, left + new_width, orig_h))
+        new_width = orig_h * target_aspect
+        left = (orig_w - new_width) / 2
+        return (left, 0, left + new_width, orig_h)
+
+@lru_cache(maxsize=64)
+def _corner_lut(radius):
+    # Top-left quarter disc of the given radius; the other corners are flips of it.
+    corner = Image.new("L", (radius, radius), 0)
+    ImageDraw.Draw(corner).ellipse((0, 0, 2 * radius, 2 * radius), fill=255)
+    return corner
 
 def create_rounded_mask(width, height, corner_radius):
-    mask = Image.new("L", (width, height), 0)
-    draw = ImageDraw.Draw(mask)
-    draw.rounded_rectangle((0, 0, width, height), radius=corner_radius, fill=255)
+    mask = Image.new("L", (width, height), 255)
+    r = min(corner_radius, width // 2, height // 2)
+    if r <= 0:
+        return mask
+    corner = _corner_lut(r)
+    mask.paste(corner, (0, 0))
+    mask.paste(corner.transpose(Image.FLIP_LEFT_RIGHT), (width - r, 0))
+    mask.paste(corner.transpose(Image.FLIP_TOP_BOTTOM), (0, height - r))
+    mask.paste(corner.transpose(Image.ROTATE_180), (width - r, height - r))
     return mask
 
+@lru_cache(maxsize=128)
+def _rounded_mask_cached(width, height, corner_radius):
+    # Shared between tiles and rebuilds; callers must only read it (crop/paste).
+    return create_rounded_mask(width, height, corner_radius)
+
+def _image_nbytes(im):
+    """Approximate memory held by a decoded image's pixels"""
+    return im.width * im.height * len(im.getbands())
+
 # ----------------------------------------------------------------
 # Tooltip Class for Preview Hover
 # ----------------------------------------------------------------
@@ -87,33 +129,45 @@ class Tooltip:
     def __init__(self, widget):
         self.widget = widget
         self.tipwindow = None
+        self.label = None
         self.text = ""
     def showtip(self, text):
-        self.text = text
-        if self.tipwindow or not self.text:
+        # One window per widget: moving between tiles only swaps the label text
+        if not text or text == self.text:
             return
-        x, y, cx, cy = self.widget.bbox("insert")
-        x = x + self.widget.winfo_rootx() + 20
-        y = y + self.widget.winfo_rooty() + 20
-        self.tipwindow = tw = tk.Toplevel(self.widget)
-        tw.wm_overrideredirect(True)
-        tw.wm_attributes("-topmost", True)
-        tw.configure(bg=SECONDARY_COLOR)
-        label = tk.Label(tw, text=self.text, justify=tk.LEFT,
-                         bg=SECONDARY_COLOR, fg=TEXT_COLOR,
-                         relief=tk.SOLID, borderwidth=1,
-                         font=("Helvetica", 9))
-        label.pack(ipadx=4)
-        tw.wm_geometry("+%d+%d" % (x, y))
+        self.text = text
+        x = self.widget.winfo_pointerx() + 20
+        y = self.widget.winfo_pointery() + 20
+        if self.tipwindow is None:
+            self.tipwindow = tw = tk.Toplevel(self.widget)
+            tw.wm_overrideredirect(True)
+            tw.wm_attributes("-topmost", True)
+            tw.configure(bg=SECONDARY_COLOR)
+            self.label = tk.Label(tw, text=self.text, justify=tk.LEFT,
+                                  bg=SECONDARY_COLOR, fg=TEXT_COLOR,
+                                  relief=tk.SOLID, borderwidth=1,
+                                  font=("Helvetica", 9))
+            self.label.pack(ipadx=4)
+        else:
+            self.label.config(text=self.text)
+            self.tipwindow.deiconify()
+        self.tipwindow.wm_geometry("+%d+%d" % (x, y))
     def hidetip(self):
         if self.tipwindow:
-            self.tipwindow.destroy()
-        self.tipwindow = None
+            self.tipwindow.withdraw()
+        self.text = ""
 
 # ----------------------------------------------------------------
 # Data Structure for an Image Entry
 # ----------------------------------------------------------------
 class ImageEntry:
+    # Fixed attribute layout: entries are walked field-by-field on every layout,
+    # listbox and preview pass, and slots avoid a per-instance dict lookup.
+    # _embedded_data is only set for images restored from a project file.
+    __slots__ = ("path", "orig_w", "orig_h", "target_w", "target_h", "x", "y",
+                 "manual_x", "manual_y", "locked", "corner_radius", "template_tag",
+                 "_embedded_data")
+
     def __init__(self, path, orig_w, orig_h, target_w, target_h):
         self.path = path  # For embedded images, may be a pseudo-path.
         self.orig_w = orig_w
@@ -142,6 +196,10 @@ class ImageEntry:
 # ----------------------------------------------------------------
 class CollageApp(tk.Tk):
     OVERFLOW_THRESHOLD = 0.5  # if >50% would overflow, move to next row
+    DECODE_CACHE_BYTES = 256 * 1024 * 1024  # decoded source pixels kept between rebuilds
+    TILE_CACHE_BYTES = 256 * 1024 * 1024    # resized tile pixels kept between rebuilds
+    PREVIEW_DELAY_MS = 80     # quiet period before a scheduled preview rebuild runs
+    CENTER_DELAY_MS = 50      # quiet period after the last preview-canvas resize event
 
     def __init__(self):
         super().__init__()
@@ -155,21 +213,36 @@ class CollageApp(tk.Tk):
         self.bg_color_var = tk.StringVar(value="#000000")
         self.corner_radius_var = tk.StringVar(value="0")
         self.scale_var = tk.StringVar(value="1")
+        self.compress_var = tk.BooleanVar(value=False)  # smaller but slower PNG saves
 
         self.images = []  # List of ImageEntry objects
+        self.layout_version = 0  # bumped by invalidate_cache on every entry/layout edit
+        self._refresh_pending = False  # a listbox rebuild is queued via after_idle
+        self._preview_after_id = None  # pending debounced update_preview, see _schedule_preview
+        self._center_after_id = None  # pending recentre after the preview canvas was resized
 
         self.templates = {}  # Dictionary to store templates {name: {"width": int, "height": int}}
         self.load_templates()  # Load templates from file
     
         self.build_main_ui()
         self.preview_window = None
-        self.preview_items = {}
+        self.preview_hit_areas = []  # [(x0, y0, x1, y1, entry)] in canvas coords, paste order
+        self.preview_image_item = None  # canvas id of the collage image, created once per window
+        self._last_draw_key = None  # update_preview settings + zoom behind the current PhotoImage
+        self.preview_highlight = None   # canvas id of the selection outline, moved not recreated
+        self.hover_entry = None
         self.selected_preview_entry = None
         self.tooltip = None
         self.preview_zoom_factor = 1.0  # Zoom factor for preview
 
         self.cached_collage = None  # Cache the full-resolution collage
         self.cached_collage_settings = None  # Track when to regenerate cache
+        self._decode_cache = OrderedDict()  # (source, decoded size) -> decoded PIL image, LRU order
+        self._tile_cache = OrderedDict()  # (source, target_w, target_h, tw, th, radius, resample) -> (tile, mask), LRU order
+        self._decode_bytes = 0  # pixel bytes currently held by _decode_cache
+        self._tile_bytes = 0    # pixel bytes currently held by _tile_cache
+        self._cache_lock = threading.Lock()  # tiles are prepared on worker threads
+        self._collage_cache = None  # (settings key, collage, tile boxes) from the last build_collage
         self.canvas_scale_factor = 1.0  # Current canvas zoom level
         self.pan_start_x = 0
         self.pan_start_y = 0
@@ -216,10 +289,9 @@ class CollageApp(tk.Tk):
 
             if updated_count > 0:
                 self.recalc_layout()
-                self.refresh_listbox()
+                self._schedule_refresh()
                 self.invalidate_cache()
-                if self.preview_window and tk.Toplevel.winfo_exists(self.preview_window):
-                    self.update_preview()
+                self._schedule_preview()
                 messagebox.showinfo("Template Updated", f"Updated {updated_count} images with template '{template_name}'")
 
 
@@ -247,6 +319,7 @@ class CollageApp(tk.Tk):
         ttk.Button(top_frame, text="Export Project", style="Accent.TButton", command=self.export_project).grid(row=0, column=13, padx=5)
         ttk.Button(top_frame, text="Import Project", style="Accent.TButton", command=self.import_project).grid(row=0, column=14, padx=5)
         ttk.Button(top_frame, text="Template", style="Accent.TButton", command=self.show_template_manager).grid(row=0, column=15, padx=5) 
+        ttk.Checkbutton(top_frame, text="Small PNG", variable=self.compress_var).grid(row=0, column=16, padx=5)
 
         lower_frame = ttk.Frame(self, padding=10)
         lower_frame.pack(fill=tk.BOTH, expand=True)
@@ -254,7 +327,7 @@ class CollageApp(tk.Tk):
         self.img_listbox = tk.Listbox(lower_frame, width=120, height=8,
                                       bg=SECONDARY_COLOR, fg=TEXT_COLOR,
                                       highlightthickness=0, bd=0,
-                                      selectbackground=darken_color(SECONDARY_COLOR, 0.3))
+                                      selectbackground=SECONDARY_SELECT)
         self.img_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
         btns_frame = ttk.Frame(lower_frame)
@@ -263,12 +336,38 @@ class CollageApp(tk.Tk):
         ttk.Button(btns_frame, text="Edit Selected", style="Accent.TButton", command=self.edit_selected_image).pack(fill=tk.X, pady=2)
         ttk.Button(btns_frame, text="Remove Selected", style="Accent.TButton", command=self.remove_selected_image).pack(fill=tk.X, pady=2)
 
+    def _schedule_refresh(self):
+        """Coalesce listbox rebuilds: any number of calls before Tk goes idle redraw once"""
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        self.after_idle(self._do_refresh)
+
+    def _do_refresh(self):
+        self._refresh_pending = False
+        self.refresh_listbox()
+
+    def _schedule_preview(self):
+        """Debounce preview rebuilds: a burst of edits or zoom clicks renders once"""
+        if not (self.preview_window and tk.Toplevel.winfo_exists(self.preview_window)):
+            return
+        if self._preview_after_id is not None:
+            self.after_cancel(self._preview_after_id)
+        self._preview_after_id = self.after(self.PREVIEW_DELAY_MS, self._do_update_preview)
+
+    def _do_update_preview(self):
+        self._preview_after_id = None
+        if self.preview_window and tk.Toplevel.winfo_exists(self.preview_window):
+            self.update_preview()
+
     def refresh_listbox(self):
-        self.img_listbox.delete(0, tk.END)
+        lines = []
         for entry in self.images:
             x, y = entry.get_display_pos()
-            info = f"File: {entry.filename} | Orig: {entry.orig_w}x{entry.orig_h} | Target: {entry.target_w}x{entry.target_h} | Pos: ({x}, {y}) | Locked: {entry.locked}"
-            self.img_listbox.insert(tk.END, info)
+            lines.append(f"File: {entry.filename} | Orig: {entry.orig_w}x{entry.orig_h} | Target: {entry.target_w}x{entry.target_h} | Pos: ({x}, {y}) | Locked: {entry.locked}")
+        # One Tcl call for all rows instead of one per image
+        self.img_listbox.delete(0, tk.END)
+        self.img_listbox.insert(tk.END, *lines)
 
     # -------------------------------------------
     # Auto-Layout with Flexible Overflow
@@ -279,6 +378,9 @@ class CollageApp(tk.Tk):
             border = int(self.border_var.get())
         except ValueError:
             return
+        # Hoist loop invariants into locals; this runs on every edit.
+        right_edge = collage_width - border
+        threshold = self.OVERFLOW_THRESHOLD
         current_x = border
         current_y = border
         current_row_height = 0
@@ -286,24 +388,23 @@ class CollageApp(tk.Tk):
             # Skip auto layout for locked images
             if entry.locked:
                 continue
-            free_space = collage_width - current_x - border
+            tw = entry.target_w
+            th = entry.target_h
+            free_space = right_edge - current_x
             if free_space <= 0:
                 current_y += current_row_height + border
                 current_x = border
                 current_row_height = 0
-                free_space = collage_width - current_x - border
-            if entry.target_w > free_space:
-                overflow = entry.target_w - free_space
-                ratio = overflow / entry.target_w
-                if ratio > self.OVERFLOW_THRESHOLD:
-                    current_y += current_row_height + border
-                    current_x = border
-                    current_row_height = 0
+                free_space = right_edge - border
+            if tw > free_space and (tw - free_space) / tw > threshold:
+                current_y += current_row_height + border
+                current_x = border
+                current_row_height = 0
             entry.x = current_x
             entry.y = current_y
-            current_row_height = max(current_row_height, entry.target_h)
-            current_x += entry.target_w + border
-            self.invalidate_cache() 
+            if th > current_row_height:
+                current_row_height = th
+            current_x += tw + border
 
     # -------------------------------------------
     # Add / Edit / Remove Images
@@ -337,10 +438,11 @@ class CollageApp(tk.Tk):
         sel_idx = self.img_listbox.curselection()
         if not sel_idx:
             return
-        self.images.pop(sel_idx[0])
+        self._evict_tiles(self.images.pop(sel_idx[0]))
         self.recalc_layout()
-        self.refresh_listbox()
+        self._schedule_refresh()
         self.invalidate_cache() 
+        self._schedule_preview()
 
     # -------------------------------------------
     # Image Settings Dialog (Add/Edit)
@@ -453,6 +555,8 @@ class CollageApp(tk.Tk):
             template_tag = template_var.get() if template_var.get() else None
 
             if entry:
+                if (tw, th, corner_radius) != (entry.target_w, entry.target_h, entry.corner_radius):
+                    self._evict_tiles(entry)  # moves and lock changes keep their rendered tiles
                 entry.target_w = tw
                 entry.target_h = th
                 entry.manual_x = manual_x
@@ -470,8 +574,9 @@ class CollageApp(tk.Tk):
                 self.images.append(new_entry)
         
             self.recalc_layout()
-            self.refresh_listbox()
+            self._schedule_refresh()
             self.invalidate_cache() 
+            self._schedule_preview()
             dialog.destroy()
     
         ttk.Button(btn_frame, text="OK", style="Accent.TButton", command=on_ok).pack(side=tk.LEFT, padx=5)
@@ -497,10 +602,9 @@ class CollageApp(tk.Tk):
         self.collage_width_var.set(str(int(w * factor)))
         self.collage_height_var.set(str(int(h * factor)))
         self.recalc_layout()
-        self.refresh_listbox()
+        self._schedule_refresh()
         self.invalidate_cache() 
-        if self.preview_window and tk.Toplevel.winfo_exists(self.preview_window):
-            self.update_preview()
+        self._schedule_preview()
 
 
     # -------------------------------------------
@@ -520,8 +624,10 @@ class CollageApp(tk.Tk):
     def save_templates(self):
         """Save templates to file"""
         try:
+            # dumps + one write: json.dump issues a write() per token
+            data = json.dumps(self.templates, indent=2)
             with open("templates.json", "w") as f:
-                json.dump(self.templates, f, indent=2)
+                f.write(data)
         except Exception as e:
             print(f"Error saving templates: {e}")
 
@@ -629,7 +735,131 @@ class CollageApp(tk.Tk):
     # -------------------------------------------
     # Build the Collage Image
     # -------------------------------------------
-    def build_collage(self):
+    def _get_decoded(self, source, draft_size=None):
+        """Return the decoded image for a file path or embedded image bytes, reusing it
+        across rebuilds until the file changes.
+
+        With draft_size, JPEGs are decoded at the smallest DCT scale (1/2, 1/4, 1/8)
+        that still covers that size, which skips most of the decode for small tiles.
+        """
+        if isinstance(source, bytes):
+            # The bytes object itself is the key: its hash is computed once and
+            # lookups for the same entry short-circuit on identity.
+            ident, fp = source, BytesIO(source)
+        else:
+            ident, fp = (source, os.path.getmtime(source)), source
+        with Image.open(fp) as im:
+            if draft_size and im.format == "JPEG":
+                im.draft(im.mode, draft_size)  # only picks the decoder scale; nothing is decoded yet
+            # Only the exact decode size counts as a hit: resampling from a larger decode
+            # left behind by another build would make the output depend on build history.
+            key = (ident, im.size)
+            with self._cache_lock:
+                cached = self._decode_cache.get(key)
+                if cached is not None:
+                    self._decode_cache.move_to_end(key)
+                    return cached
+            im.load()
+            decoded = im.copy()
+        with self._cache_lock:
+            if key not in self._decode_cache:  # another worker may have decoded it meanwhile
+                self._decode_cache[key] = decoded
+                self._decode_bytes += _image_nbytes(decoded)
+            # Evict by size, not count: one 24 MP photo outweighs dozens of thumbnails.
+            # The newest entry stays even if it alone is over budget.
+            while self._decode_bytes > self.DECODE_CACHE_BYTES and len(self._decode_cache) > 1:
+                _, old = self._decode_cache.popitem(last=False)
+                self._decode_bytes -= _image_nbytes(old)
+        return decoded
+
+    def _source_mtime(self, entry):
+        if entry.path.startswith("<embedded:"):
+            return None
+        try:
+            return os.path.getmtime(entry.path)
+        except OSError:
+            return None
+
+    def _tile_source(self, entry):
+        """Identity of an entry's pixels: the file and its mtime, or the embedded bytes"""
+        if entry.path.startswith("<embedded:") and hasattr(entry, "_embedded_data"):
+            return entry._embedded_data
+        return (entry.path, self._source_mtime(entry))
+
+    def _evict_tiles(self, entry):
+        """Drop cached tiles rendered for this entry's source at its current target size,
+        unless another entry still uses the same file at that size"""
+        prefix = (self._tile_source(entry), entry.target_w, entry.target_h)
+        if any(other is not entry and (self._tile_source(other), other.target_w, other.target_h) == prefix
+               for other in self.images):
+            return
+        with self._cache_lock:
+            for key in [k for k in self._tile_cache if k[:3] == prefix]:
+                self._tile_bytes -= _image_nbytes(self._tile_cache.pop(key)[0])
+
+    def _drop_preview_tiles(self, scale):
+        """Forget tiles rendered for other preview zoom levels. Fit and zoom land on
+        arbitrary scales, so they would otherwise push the full-size tiles out."""
+        with self._cache_lock:
+            for key in [k for k in self._tile_cache if k[3:5] != k[1:3]
+                        and k[3:5] != (max(1, round(k[1] * scale)), max(1, round(k[2] * scale)))]:
+                self._tile_bytes -= _image_nbytes(self._tile_cache.pop(key)[0])
+
+    def _prepare_tile(self, entry, scale, resample):
+        """Decode, crop and resize one entry. Runs on a worker thread; returns (tile, mask) or None."""
+        tw = max(1, round(entry.target_w * scale))
+        th = max(1, round(entry.target_h * scale))
+        radius = round(entry.corner_radius * scale)
+        # target_w/target_h fix the crop aspect; tw/th/radius/resample the rendered pixels
+        key = (self._tile_source(entry), entry.target_w, entry.target_h, tw, th, radius, resample)
+        with self._cache_lock:
+            cached = self._tile_cache.get(key)
+            if cached is not None:
+                self._tile_cache.move_to_end(key)
+                return cached
+        try:
+            # Fraction of the source resolution the tile needs, with the same 2x
+            # headroom Image.thumbnail keeps so the final LANCZOS pass has detail to work with
+            left, top, right, bottom = crop_to_aspect_box(entry.orig_w, entry.orig_h,
+                                                          entry.target_w, entry.target_h)
+            need = 2.0 * max(tw / (right - left), th / (bottom - top))
+            draft_size = None
+            if need < 1.0:
+                draft_size = (math.ceil(entry.orig_w * need), math.ceil(entry.orig_h * need))
+            if entry.path.startswith("<embedded:") and hasattr(entry, "_embedded_data"):
+                im = self._get_decoded(entry._embedded_data, draft_size)
+            else:
+                im = self._get_decoded(entry.path, draft_size)
+            box = crop_to_aspect_box(im.width, im.height, entry.target_w, entry.target_h)
+            # reducing_gap: big downscales first shrink by an integer factor with
+            # Image.reduce (cheap box filter) until within 2x of the target.
+            resized = im.resize((tw, th), resample, box=box, reducing_gap=2.0)
+        except Exception as e:
+            print(f"Error processing {entry.path}: {e}")
+            return None
+        # Convert once here, on the worker thread, rather than letting every paste()
+        # of a cached tile convert it to the canvas mode again. Tiles stay RGB unless
+        # some pixel is actually transparent, so opaque collages need no alpha channel.
+        if resized.mode in ("RGBA", "LA", "PA") or "transparency" in resized.info:
+            resized = resized.convert("RGBA")
+            if resized.getextrema()[3][0] == 255:
+                resized = resized.convert("RGB")
+        elif resized.mode != "RGB":
+            resized = resized.convert("RGB")
+        mask = None
+        if radius > 0:
+            mask = _rounded_mask_cached(tw, th, radius)
+        with self._cache_lock:
+            if key not in self._tile_cache:
+                self._tile_cache[key] = (resized, mask)
+                self._tile_bytes += _image_nbytes(resized)
+            while self._tile_bytes > self.TILE_CACHE_BYTES and len(self._tile_cache) > 1:
+                _, (old, _) = self._tile_cache.popitem(last=False)
+                self._tile_bytes -= _image_nbytes(old)
+        return resized, mask
+
+    def build_collage(self, scale=1.0):
+        """Compose the collage. scale < 1 renders a smaller copy directly (for previews)."""
         try:
             cw = int(self.collage_width_var.get())
             ch = int(self.collage_height_var.get())
@@ -639,44 +869,90 @@ class CollageApp(tk.Tk):
             messagebox.showwarning("Invalid Settings", "Width, Height, Border, and Corner Radius must be integers.")
             return None
         bg_rgba = parse_hex_color(self.bg_color_var.get())
-        collage = Image.new("RGBA", (cw, ch), bg_rgba)
-        safe_area = (border, border, cw - border, ch - border)
         self.recalc_layout()
-        for entry in self.images:
-            try:
-                if entry.path.startswith("<embedded:") and hasattr(entry, "_embedded_data"):
-                    im = Image.open(BytesIO(entry._embedded_data))
-                else:
-                    im = Image.open(entry.path)
-                cropped = crop_to_aspect(im, entry.target_w, entry.target_h)
-                resized = cropped.resize((entry.target_w, entry.target_h), Image.LANCZOS)
-                im.close()
-            except Exception as e:
-                print(f"Error processing {entry.path}: {e}")
+        key = (cw, ch, border, bg_rgba, scale,
+               tuple((id(entry), entry.target_w, entry.target_h, entry.get_display_pos(),
+                      entry.corner_radius, self._tile_source(entry)) for entry in self.images))
+        if self._collage_cache is not None and self._collage_cache[0] == key:
+            return self._collage_cache[1]
+        # Scaled-down previews are resampled straight to their final size, and a
+        # bilinear filter is plenty there; saving (scale 1.0) keeps LANCZOS.
+        resample = Image.LANCZOS if scale >= 1.0 else Image.BILINEAR
+        if scale < 1.0:
+            self._drop_preview_tiles(scale)
+        cw = max(1, int(cw * scale))
+        ch = max(1, int(ch * scale))
+        border = round(border * scale)
+        # Decoding and resampling release the GIL inside Pillow, so tiles are prepared
+        # in parallel; pasting stays on this thread, in list order, to keep the layering.
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+            tiles = list(pool.map(lambda entry: self._prepare_tile(entry, scale, resample), self.images))
+        # The background is always opaque, so the collage only needs an alpha
+        # channel when a tile brings transparency of its own.
+        if any(tile is not None and tile[0].mode == "RGBA" for tile in tiles):
+            mode, bg = "RGBA", bg_rgba
+        else:
+            mode, bg = "RGB", bg_rgba[:3]
+        boxes = []
+        for entry, tile in zip(self.images, tiles):
+            if tile is None:
+                boxes.append(None)
                 continue
-            mask = None
-            if entry.corner_radius > 0:
-                mask = create_rounded_mask(resized.width, resized.height, entry.corner_radius)
-                if resized.mode != "RGBA":
-                    resized = resized.convert("RGBA")
-            x = entry.manual_x if entry.manual_x is not None else entry.x
-            y = entry.manual_y if entry.manual_y is not None else entry.y
-            img_box = (x, y, x + entry.target_w, y + entry.target_h)
-            inter = (max(img_box[0], safe_area[0]),
-                     max(img_box[1], safe_area[1]),
-                     min(img_box[2], safe_area[2]),
-                     min(img_box[3], safe_area[3]))
-            if inter[0] < inter[2] and inter[1] < inter[3]:
-                src_x = inter[0] - x
-                src_y = inter[1] - y
-                src_x2 = src_x + (inter[2] - inter[0])
-                src_y2 = src_y + (inter[3] - inter[1])
-                portion = resized.crop((src_x, src_y, src_x2, src_y2))
-                if mask is not None:
-                    portion_mask = mask.crop((src_x, src_y, src_x2, src_y2))
-                    collage.paste(portion, inter, portion_mask)
-                else:
-                    collage.paste(portion, inter)
+            x, y = entry.get_display_pos()
+            x, y = round(x * scale), round(y * scale)
+            boxes.append((x, y, x + tile[0].width, y + tile[0].height))
+        collage = self._redraw_changed(key, tiles, boxes, mode, bg)
+        if collage is None:
+            prev = self._collage_cache[1] if self._collage_cache is not None else None
+            if prev is not None and prev.mode == mode and prev.size == (cw, ch):
+                # Refill the last canvas in place; a fill is much cheaper than a fresh allocation.
+                collage = prev
+                collage.paste(bg, (0, 0, cw, ch))
+            else:
+                collage = Image.new(mode, (cw, ch), bg)
+            for tile, box in zip(tiles, boxes):
+                if tile is not None:
+                    # Paste the whole tile (Pillow clips to the canvas); the border is restored below.
+                    collage.paste(tile[0], box[:2], tile[1])
+        # Repaint the border strips once instead of cropping every tile to the safe area.
+        if border > 0:
+            collage.paste(bg, (0, 0, cw, border))
+            collage.paste(bg, (0, ch - border, cw, ch))
+            collage.paste(bg, (0, 0, border, ch))
+            collage.paste(bg, (cw - border, 0, cw, ch))
+        self._collage_cache = (key, collage, boxes)
+        return collage
+
+    def _redraw_changed(self, key, tiles, boxes, mode, bg):
+        """Patch the last collage in place when only a few tiles changed; None means rebuild.
+
+        Each dirty box (a changed tile's old and new area) is redrawn from the background
+        up with every tile that overlaps it, in list order, so the layering is unchanged.
+        """
+        if self._collage_cache is None:
+            return None
+        prev_key, collage, prev_boxes = self._collage_cache
+        if prev_key[:5] != key[:5] or collage.mode != mode:
+            return None
+        if [e[0] for e in prev_key[5]] != [e[0] for e in key[5]]:
+            return None  # entries were added, removed or reordered
+        cw, ch = collage.size
+        dirty = []
+        for old, new, old_box, new_box in zip(prev_key[5], key[5], prev_boxes, boxes):
+            if old == new and old_box == new_box:
+                continue
+            for l, t, r, b in filter(None, (old_box, new_box)):
+                l, t, r, b = max(l, 0), max(t, 0), min(r, cw), min(b, ch)
+                if l < r and t < b:
+                    dirty.append((l, t, r, b))
+        if sum((r - l) * (b - t) for l, t, r, b in dirty) > cw * ch // 2:
+            return None  # e.g. a resize that reflowed the layout; a full rebuild is cheaper
+        for l, t, r, b in dirty:
+            region = Image.new(mode, (r - l, b - t), bg)
+            for tile, box in zip(tiles, boxes):
+                if tile is not None and box[0] < r and box[2] > l and box[1] < b and box[3] > t:
+                    region.paste(tile[0], (box[0] - l, box[1] - t), tile[1])
+            collage.paste(region, (l, t))
         return collage
 
     # -------------------------------------------
@@ -752,10 +1028,17 @@ class CollageApp(tk.Tk):
         self.manual_y_entry.grid(row=1, column=1, padx=2, pady=2)
         ttk.Button(pos_frame, text="Set", style="Accent.TButton", command=self.set_manual_position).grid(row=2, column=0, columnspan=2, pady=5)
 
-        self.preview_items = {}
+        self.preview_hit_areas = []
+        self.preview_image_item = None
+        self.preview_highlight = self.canvas.create_rectangle(0, 0, 0, 0, outline=ACCENT_COLOR, width=3,
+                                                              state="hidden", tags="highlight")
+        self.hover_entry = None
         self.selected_preview_entry = None
         self.tooltip = Tooltip(self.canvas)
         self.canvas.bind("<Configure>", self.on_canvas_configure)
+        self.canvas.bind("<Motion>", self.on_canvas_motion)
+        self.canvas.bind("<Leave>", self.on_img_leave)
+        self.canvas.bind("<Button-1>", self.on_img_click)
         self.invalidate_cache() 
         self.update_preview()
 
@@ -763,22 +1046,33 @@ class CollageApp(tk.Tk):
         self.canvas_scale_factor = max(0.1, min(zoom_level, 5.0))
         self.canvas_offset_x = 0  # Reset pan when using presets
         self.canvas_offset_y = 0
-        self.update_preview()
+        self._schedule_preview()
 
     def invalidate_cache(self):
         """Call this whenever layout changes to force cache regeneration"""
+        self.layout_version += 1
         self.cached_collage = None
         self.cached_collage_settings = None
 
     def on_canvas_configure(self, event):
-        self.center_preview_image()
+        # <Configure> fires for every step of a window drag; recentre once it settles
+        if self._center_after_id is not None:
+            self.after_cancel(self._center_after_id)
+        self._center_after_id = self.after(self.CENTER_DELAY_MS, self.center_preview_image)
 
     def center_preview_image(self):
-        items = self.canvas.find_withtag("preview_image")
-        if items:
-            canvas_width = self.canvas.winfo_width()
-            canvas_height = self.canvas.winfo_height()
-            self.canvas.coords(items[0], canvas_width/2, canvas_height/2)
+        self._center_after_id = None
+        if self.preview_image_item is None or not tk.Toplevel.winfo_exists(self.preview_window):
+            return
+        x, y = self.canvas.coords(self.preview_image_item)
+        dx = self.canvas.winfo_width()/2 + self.canvas_offset_x - x
+        dy = self.canvas.winfo_height()/2 + self.canvas_offset_y - y
+        if dx or dy:
+            # Move the hit areas and the selection outline along with the image
+            self.canvas.move(self.preview_image_item, dx, dy)
+            self.canvas.move(self.preview_highlight, dx, dy)
+            self.preview_hit_areas = [(x0 + dx, y0 + dy, x1 + dx, y1 + dy, entry)
+                                      for x0, y0, x1, y1, entry in self.preview_hit_areas]
 
     def edit_selected_from_preview_dialog(self):
         """Open full edit dialog for selected image from preview"""
@@ -787,47 +1081,67 @@ class CollageApp(tk.Tk):
                                   self.selected_preview_entry.orig_w, 
                                   self.selected_preview_entry.orig_h, 
                                   self.selected_preview_entry)
-        # Refresh preview after editing
-        if self.preview_window and tk.Toplevel.winfo_exists(self.preview_window):
-            self.update_preview()
+        # The dialog is not modal; its OK handler schedules the preview refresh.
 
     def update_preview(self):
         # Check if we need to regenerate the cached collage
+        # Entry edits all go through invalidate_cache, which bumps layout_version,
+        # so the key doesn't need to walk the image list.
         current_settings = (
             self.collage_width_var.get(),
             self.collage_height_var.get(), 
             self.border_var.get(),
             self.bg_color_var.get(),
-            len(self.images),
-            tuple((img.target_w, img.target_h, img.get_display_pos(), img.locked) for img in self.images)
+            self.layout_version
         )
+        # Zoomed-out previews are rendered directly at display size; zooming in
+        # upscales the full-resolution render. A full-resolution render is resized
+        # instead when one is already cached, or when the sources won't fit the decode
+        # cache: every rebuild would then decode them all again from disk.
+        render_scale = min(1.0, self.canvas_scale_factor)
+        if render_scale < 1.0:
+            full_settings = current_settings + (1.0,)
+            source_bytes = sum(entry.orig_w * entry.orig_h * 3 for entry in self.images)
+            if self.cached_collage_settings == full_settings or source_bytes > self.DECODE_CACHE_BYTES:
+                render_scale = 1.0
+        current_settings += (render_scale,)
+
+        # Same layout at the same zoom (a preset or fit that lands where we already
+        # are): keep the current PhotoImage and at most move it for the pan offset.
+        draw_key = current_settings + (self.canvas_scale_factor,)
+        if (self.preview_image_item is not None and draw_key == self._last_draw_key
+                and self.cached_collage_settings == current_settings):
+            self.center_preview_image()
+            return
     
         if self.cached_collage is None or self.cached_collage_settings != current_settings:
             print("Regenerating collage cache...")
-            self.cached_collage = self.build_collage()
+            self.cached_collage = self.build_collage(render_scale)
             self.cached_collage_settings = current_settings
             if self.cached_collage is None:
                 return
     
-        # Use cached collage and scale it
         collage_img = self.cached_collage
-        cw, ch = collage_img.size
+        cw = int(self.collage_width_var.get())
+        ch = int(self.collage_height_var.get())
     
         # Calculate display size based on canvas scale factor
-        display_w = int(cw * self.canvas_scale_factor)
-        display_h = int(ch * self.canvas_scale_factor)
+        display_w = max(1, int(cw * self.canvas_scale_factor))
+        display_h = max(1, int(ch * self.canvas_scale_factor))
     
-        # Only resize if we need to (avoid unnecessary operations)
-        if self.canvas_scale_factor != 1.0:
-            preview_img = collage_img.resize((display_w, display_h), Image.LANCZOS)
+        # Only resize if we need to (avoid unnecessary operations). BILINEAR is plenty
+        # for a preview and roughly half the cost of LANCZOS; when shrinking a
+        # full-resolution render, reducing_gap box-reduces most of the way first.
+        if collage_img.size != (display_w, display_h):
+            preview_img = collage_img.resize((display_w, display_h), Image.BILINEAR, reducing_gap=2.0)
         else:
             preview_img = collage_img
     
         self.zoom_label.config(text=f"{int(self.canvas_scale_factor*100)}%")
-        self.preview_photo = ImageTk.PhotoImage(preview_img)
+        self.preview_photo = self._photo_from_image(preview_img)
     
-        # Clear and redraw
-        self.canvas.delete("all")
+        # The selection outline belongs to the previous layout/zoom
+        self.canvas.itemconfig(self.preview_highlight, state="hidden")
         canvas_width = self.canvas.winfo_width() or display_w
         canvas_height = self.canvas.winfo_height() or display_h
     
@@ -835,15 +1149,34 @@ class CollageApp(tk.Tk):
         img_x = canvas_width/2 + self.canvas_offset_x
         img_y = canvas_height/2 + self.canvas_offset_y
     
-        self.canvas.create_image(img_x, img_y, anchor="center", image=self.preview_photo, tags="preview_image")
+        # Reuse the one image item; only swap its photo and move it
+        if self.preview_image_item is None:
+            self.preview_image_item = self.canvas.create_image(img_x, img_y, anchor="center",
+                                                               image=self.preview_photo, tags="preview_image")
+        else:
+            self.canvas.itemconfig(self.preview_image_item, image=self.preview_photo)
+            self.canvas.coords(self.preview_image_item, img_x, img_y)
     
         # Update interactive rectangles
         self.update_preview_rectangles(display_w, display_h, img_x - display_w/2, img_y - display_h/2)
+        self._last_draw_key = draw_key
+
+    def _photo_from_image(self, img):
+        """Hand the preview to Tk as one PPM blob, decoded by Tk's own PPM reader"""
+        if img.mode == "RGBA" and img.getextrema()[3][0] < 255:
+            bg = Image.new("RGBA", img.size, parse_hex_color(self.bg_color_var.get()))
+            img = Image.alpha_composite(bg, img)
+        buf = BytesIO()
+        img.convert("RGB").save(buf, "PPM")
+        return tk.PhotoImage(data=base64.b64encode(buf.getvalue()), format="PPM")
 
     def update_preview_rectangles(self, display_w, display_h, offset_x, offset_y):
-        self.preview_items.clear()
+        # Plain hit areas instead of one canvas item (and three bindings) per image;
+        # the canvas-wide <Motion>/<Button-1> handlers look entries up here.
+        self.preview_hit_areas = []
+        self.hover_entry = None
     
-        for idx, entry in enumerate(self.images):
+        for entry in self.images:
             pos = entry.get_display_pos()
             if pos[0] is None or pos[1] is None:
                 continue
@@ -853,28 +1186,34 @@ class CollageApp(tk.Tk):
             y_s = y * self.canvas_scale_factor + offset_y
             w_s = entry.target_w * self.canvas_scale_factor
             h_s = entry.target_h * self.canvas_scale_factor
-        
-            rect = self.canvas.create_rectangle(x_s, y_s, x_s + w_s, y_s + h_s,
-                                            outline="", width=2,
-                                            tags=("img", f"img_{idx}"))
-            self.preview_items[rect] = entry
-            self.canvas.tag_bind(rect, "<Enter>", self.on_img_enter)
-            self.canvas.tag_bind(rect, "<Leave>", self.on_img_leave)
-            self.canvas.tag_bind(rect, "<Button-1>", self.on_img_click)
+            self.preview_hit_areas.append((x_s, y_s, x_s + w_s, y_s + h_s, entry))
+
+    def hit_test(self, event):
+        """Return the topmost (x0, y0, x1, y1, entry) under the pointer, or None"""
+        x = self.canvas.canvasx(event.x)
+        y = self.canvas.canvasy(event.y)
+        # Later images are pasted over earlier ones, so search from the end.
+        for area in reversed(self.preview_hit_areas):
+            if area[0] <= x < area[2] and area[1] <= y < area[3]:
+                return area
+        return None
 
     def zoom_in(self):
         self.canvas_scale_factor = min(self.canvas_scale_factor * 1.5, 5.0)  # Limit to 500%
-        self.update_preview()
+        self._schedule_preview()
 
     def zoom_out(self):
         self.canvas_scale_factor = max(self.canvas_scale_factor / 1.5, 0.1)  # Limit to 10%
-        self.update_preview()
+        self._schedule_preview()
 
     def fit_to_window(self):
-        if self.cached_collage is None:
+        try:
+            cw = int(self.collage_width_var.get())
+            ch = int(self.collage_height_var.get())
+        except ValueError:
+            return
+        if cw <= 0 or ch <= 0:
             return
-    
-        cw, ch = self.cached_collage.size
         canvas_width = self.canvas.winfo_width()
         canvas_height = self.canvas.winfo_height()
     
@@ -886,54 +1225,50 @@ class CollageApp(tk.Tk):
         self.canvas_scale_factor = min(scale_x, scale_y)
         self.canvas_offset_x = 0  # Reset pan
         self.canvas_offset_y = 0
-        self.update_preview()
+        self._schedule_preview()
 
-    def on_img_enter(self, event):
-        item = self.canvas.find_withtag("current")
-        if item:
-            entry = self.preview_items.get(item[0])
-            if entry:
-                x, y = entry.get_display_pos()
-                text = (f"File: {entry.filename}\n"
-                        f"Orig: {entry.orig_w}x{entry.orig_h}\n"
-                        f"Target: {entry.target_w}x{entry.target_h}\n"
-                        f"Pos: ({x}, {y})\n"
-                        f"Locked: {entry.locked}")
-                self.tooltip.showtip(text)
+    def on_canvas_motion(self, event):
+        area = self.hit_test(event)
+        entry = area[4] if area else None
+        if entry is self.hover_entry:
+            return
+        self.hover_entry = entry
+        if entry:
+            x, y = entry.get_display_pos()
+            text = (f"File: {entry.filename}\n"
+                    f"Orig: {entry.orig_w}x{entry.orig_h}\n"
+                    f"Target: {entry.target_w}x{entry.target_h}\n"
+                    f"Pos: ({x}, {y})\n"
+                    f"Locked: {entry.locked}")
+            self.tooltip.showtip(text)
+        else:
+            self.tooltip.hidetip()
 
     def on_img_leave(self, event):
+        self.hover_entry = None
         self.tooltip.hidetip()
 
     def on_img_click(self, event):
-        item = self.canvas.find_withtag("current")
-        if item:
-            entry = self.preview_items.get(item[0])
-            if entry:
-                self.canvas.delete("highlight")
-                pos = entry.get_display_pos()
-                final_scale = ( (self.canvas.winfo_width() / max(int(self.collage_width_var.get()),1)) * self.preview_zoom_factor )
-                canvas_width = self.canvas.winfo_width()
-                canvas_height = self.canvas.winfo_height()
-                offset_x = canvas_width/2 - (int(self.collage_width_var.get()) * final_scale)/2
-                offset_y = canvas_height/2 - (int(self.collage_height_var.get()) * final_scale)/2
-                x_s = pos[0] * final_scale + offset_x
-                y_s = pos[1] * final_scale + offset_y
-                w_s = entry.target_w * final_scale
-                h_s = entry.target_h * final_scale
-                self.canvas.create_rectangle(x_s, y_s, x_s + w_s, y_s + h_s,
-                                             outline=ACCENT_COLOR, width=3, tags="highlight")
-                details = (f"File: {entry.filename}\n"
-                           f"Original: {entry.orig_w} x {entry.orig_h}\n"
-                           f"Target: {entry.target_w} x {entry.target_h}\n"
-                           f"Position: ({pos[0]}, {pos[1]})\n"
-                           f"Locked: {entry.locked}")
-                self.details_label.config(text=details)
-                self.selected_preview_entry = entry
-                # Populate manual position entries with current values:
-                self.manual_x_entry.delete(0, tk.END)
-                self.manual_y_entry.delete(0, tk.END)
-                self.manual_x_entry.insert(0, str(pos[0]) if pos[0] is not None else "")
-                self.manual_y_entry.insert(0, str(pos[1]) if pos[1] is not None else "")
+        area = self.hit_test(event)
+        if not area:
+            return
+        x_s, y_s, x2_s, y2_s, entry = area
+        pos = entry.get_display_pos()
+        self.canvas.coords(self.preview_highlight, x_s, y_s, x2_s, y2_s)
+        self.canvas.itemconfig(self.preview_highlight, state="normal")
+        self.canvas.tag_raise(self.preview_highlight)
+        details = (f"File: {entry.filename}\n"
+                   f"Original: {entry.orig_w} x {entry.orig_h}\n"
+                   f"Target: {entry.target_w} x {entry.target_h}\n"
+                   f"Position: ({pos[0]}, {pos[1]})\n"
+                   f"Locked: {entry.locked}")
+        self.details_label.config(text=details)
+        self.selected_preview_entry = entry
+        # Populate manual position entries with current values:
+        self.manual_x_entry.delete(0, tk.END)
+        self.manual_y_entry.delete(0, tk.END)
+        self.manual_x_entry.insert(0, str(pos[0]) if pos[0] is not None else "")
+        self.manual_y_entry.insert(0, str(pos[1]) if pos[1] is not None else "")
 
     def edit_selected_from_preview(self):
         # Renamed from "Edit" to "Info" – this simply shows the info.
@@ -952,9 +1287,9 @@ class CollageApp(tk.Tk):
             self.selected_preview_entry.locked = not self.selected_preview_entry.locked
             state = "Locked" if self.selected_preview_entry.locked else "Unlocked"
             messagebox.showinfo("Lock Toggled", f"{self.selected_preview_entry.filename} is now {state}.")
-            self.refresh_listbox()
+            self._schedule_refresh()
             self.invalidate_cache() 
-            self.update_preview()
+            self._schedule_preview()
 
     def set_manual_position(self):
         # Set manual x and y for the selected image.
@@ -971,9 +1306,9 @@ class CollageApp(tk.Tk):
         self.selected_preview_entry.manual_y = new_y
         # When manually set, also lock the image automatically.
         self.selected_preview_entry.locked = True
-        self.refresh_listbox()
+        self._schedule_refresh()
         self.invalidate_cache() 
-        self.update_preview()
+        self._schedule_preview()
 
     # -------------------------------------------
     # Export Project (Embed all image data)
@@ -985,45 +1320,48 @@ class CollageApp(tk.Tk):
         )
         if not save_path:
             return
+        tmp_path = save_path + ".tmp"
         try:
-            project_data = {
-                "collage_settings": {
-                    "width": self.collage_width_var.get(),
-                    "height": self.collage_height_var.get(),
-                    "border": self.border_var.get(),
-                    "bg_color": self.bg_color_var.get(),
-                    "corner_radius": self.corner_radius_var.get(),
-                    "scale": self.scale_var.get(),
-                },
-                "images": []
+            settings = {
+                "width": self.collage_width_var.get(),
+                "height": self.collage_height_var.get(),
+                "border": self.border_var.get(),
+                "bg_color": self.bg_color_var.get(),
+                "corner_radius": self.corner_radius_var.get(),
+                "scale": self.scale_var.get(),
             }
-            for entry in self.images:
-                if entry.path.startswith("<embedded:") and hasattr(entry, "_embedded_data"):
-                    raw_bytes = entry._embedded_data
-                else:
-                    with open(entry.path, "rb") as f:
-                        raw_bytes = f.read()
-                b64_data = base64.b64encode(raw_bytes).decode("utf-8")
-                img_info = {
-                    "orig_w": entry.orig_w,
-                    "orig_h": entry.orig_h,
-                    "target_w": entry.target_w,
-                    "target_h": entry.target_h,
-                    "manual_x": entry.manual_x,
-                    "manual_y": entry.manual_y,
-                    "x": entry.x,
-                    "y": entry.y,
-                    "locked": entry.locked,
-                    "filename": entry.filename,
-                    "template_tag": entry.template_tag,
-                    "image_data": b64_data
-                }
-                project_data["images"].append(img_info)
-            json_str = json.dumps(project_data, indent=2)
-            with open(save_path, "w", encoding="utf-8") as f:
-                f.write(json_str)
+            # Stored (uncompressed) zip: the images are already compressed, so their
+            # bytes go in as-is next to a small JSON manifest instead of as base64.
+            manifest = {"collage_settings": settings, "images": []}
+            with zipfile.ZipFile(tmp_path, "w", zipfile.ZIP_STORED) as zf:
+                for i, entry in enumerate(self.images):
+                    blob = f"images/img_{i}"
+                    if entry.path.startswith("<embedded:") and hasattr(entry, "_embedded_data"):
+                        zf.writestr(blob, entry._embedded_data)
+                    else:
+                        zf.write(entry.path, blob)
+                    manifest["images"].append({
+                        "orig_w": entry.orig_w,
+                        "orig_h": entry.orig_h,
+                        "target_w": entry.target_w,
+                        "target_h": entry.target_h,
+                        "manual_x": entry.manual_x,
+                        "manual_y": entry.manual_y,
+                        "x": entry.x,
+                        "y": entry.y,
+                        "locked": entry.locked,
+                        "filename": entry.filename,
+                        "template_tag": entry.template_tag,
+                        "blob": blob
+                    })
+                zf.writestr("manifest.json", json.dumps(manifest, indent=2))
+            os.replace(tmp_path, save_path)
             messagebox.showinfo("Export Successful", f"Project exported to {save_path}")
         except Exception as e:
+            try:
+                os.remove(tmp_path)  # don't leave the half-written archive next to the target
+            except OSError:
+                pass
             messagebox.showerror("Error", f"Failed to export project:\n{e}")
 
     # -------------------------------------------
@@ -1037,20 +1375,21 @@ class CollageApp(tk.Tk):
         if not load_path:
             return
         try:
-            with open(load_path, "r", encoding="utf-8") as f:
-                json_str = f.read()
-            project_data = json.loads(json_str)
-            cset = project_data["collage_settings"]
-            self.collage_width_var.set(cset["width"])
-            self.collage_height_var.set(cset["height"])
-            self.border_var.set(cset["border"])
-            self.bg_color_var.set(cset["bg_color"])
-            self.corner_radius_var.set(cset["corner_radius"])
-            self.scale_var.set(cset.get("scale", "2"))
-            self.images.clear()
-            for img_info in project_data["images"]:
-                b64_data = img_info["image_data"]
-                raw_bytes = base64.b64decode(b64_data)
+            with open(load_path, "rb") as f:
+                is_zip = f.read(4) == b"PK\x03\x04"
+            if is_zip:
+                with zipfile.ZipFile(load_path) as zf:
+                    project_data = json.loads(zf.read("manifest.json"))
+                    blobs = [zf.read(img_info["blob"]) for img_info in project_data["images"]]
+            else:
+                # Older projects: one JSON document with base64 image data inline
+                with open(load_path, "r", encoding="utf-8") as f:
+                    project_data = json.load(f)
+                blobs = [base64.b64decode(img_info["image_data"]) for img_info in project_data["images"]]
+            # Build and check every entry before touching the current project, so a
+            # bad blob leaves the old collage (and the listbox showing it) intact.
+            new_images = []
+            for img_info, raw_bytes in zip(project_data["images"], blobs):
                 pseudo_path = f"<embedded:{img_info.get('filename','unknown')}>"
                 new_entry = ImageEntry(
                     path=pseudo_path,
@@ -1065,9 +1404,23 @@ class CollageApp(tk.Tk):
                 new_entry.y = img_info["y"]
                 new_entry.locked = img_info.get("locked", False)
                 new_entry.template_tag = img_info.get("template_tag", None)  
-                new_entry._embedded_data = raw_bytes
-                self.images.append(new_entry)
-            self.refresh_listbox()
+                new_entry._embedded_data = raw_bytes  # kept for re-export
+                with Image.open(BytesIO(raw_bytes)):
+                    pass  # header check only; pixels are decoded on demand by the builds
+                new_images.append(new_entry)
+            cset = project_data["collage_settings"]
+            width, height, border = cset["width"], cset["height"], cset["border"]
+            bg_color, corner_radius = cset["bg_color"], cset["corner_radius"]
+            self.collage_width_var.set(width)
+            self.collage_height_var.set(height)
+            self.border_var.set(border)
+            self.bg_color_var.set(bg_color)
+            self.corner_radius_var.set(corner_radius)
+            self.scale_var.set(cset.get("scale", "2"))
+            self.images[:] = new_images
+            self._schedule_refresh()
+            self.invalidate_cache()
+            self._schedule_preview()
             messagebox.showinfo("Import Successful", f"Project loaded from {load_path}")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to import project:\n{e}")
@@ -1088,12 +1441,24 @@ class CollageApp(tk.Tk):
         )
         if save_path:
             try:
-                collage_img.save(save_path)
+                if os.path.splitext(save_path)[1].lower() == ".png":
+                    # zlib level 1 is several times faster than the default level 6 for a
+                    # slightly bigger file; "Small PNG" asks for maximum compression instead.
+                    if self.compress_var.get():
+                        collage_img.save(save_path, optimize=True)
+                    else:
+                        collage_img.save(save_path, compress_level=1, optimize=False)
+                elif collage_img.mode == "RGBA" and os.path.splitext(save_path)[1].lower() in (".jpg", ".jpeg"):
+                    collage_img.convert("RGB").save(save_path)  # JPEG has no alpha channel
+                else:
+                    collage_img.save(save_path)
                 messagebox.showinfo("Saved", f"Collage saved to {save_path}")
             except Exception as e:
                 messagebox.showerror("Error", f"Could not save collage: {e}")
 
 if __name__ == "__main__":
+    print(f"Pillow {PIL.__version__}" + (" (SIMD build)" if PILLOW_SIMD else "")
+          + ("" if JPEG_TURBO else " - JPEG decoding without libjpeg-turbo"))
     app = CollageApp()
     app.recalc_layout()
     app.refresh_listbox()